@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import html
+import time
 from pathlib import Path
 from typing import List, Tuple
 
+import pandas as pd
 import streamlit as st
 
 from components.bulk_edit import render_bulk_edit_panel
@@ -14,23 +17,34 @@ from config import (
     ASSETS_DIR,
     AUDIT_LOG_FILE,
     CLIENTS_FILE,
+    DATA_CACHE_TTL_SECONDS,
     DATA_DIR,
+    EDITABLE_COLUMNS,
+    FILE_MTIME_CHECK_SECONDS,
     FILTER_COLUMNS,
     USER_INPUTS_FILE,
 )
 from services import audit_service, data_loader, filter_service, validation_service
-from utils.helpers import get_current_username
+from utils.helpers import file_signature, get_current_username
 
 
 st.set_page_config(page_title="Client Review Dashboard", layout="wide")
 
 
+@st.cache_resource(show_spinner=False)
+def read_css() -> str:
+    """Read app-level CSS once per process from the assets directory."""
+    css_path = ASSETS_DIR / "styles.css"
+    if not css_path.exists():
+        return ""
+    return css_path.read_text(encoding="utf-8")
+
+
 def load_css() -> None:
     """Load app-level CSS styling from the assets directory."""
-    css_path = ASSETS_DIR / "styles.css"
-    if css_path.exists():
-        with css_path.open("r", encoding="utf-8") as css_file:
-            st.markdown(f"<style>{css_file.read()}</style>", unsafe_allow_html=True)
+    css = read_css()
+    if css:
+        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
 
 
 def init_session_state() -> None:
@@ -40,7 +54,7 @@ def init_session_state() -> None:
     st.session_state.setdefault("user_name", get_current_username())
     st.session_state.setdefault("notifications", [])
     st.session_state.setdefault("validation_messages", [])
-    st.session_state.setdefault("last_filter_signature", tuple())
+    st.session_state.setdefault("last_filter_signature", frozenset())
     st.session_state.setdefault("status_overrides", {})
 
 
@@ -91,12 +105,10 @@ def show_validation_messages() -> None:
     if not messages:
         return
 
-    for message in messages:
-        safe_message = message.replace("<", "&lt;").replace(">", "&gt;")
-        st.markdown(
-            f'<div class="validation-message">{safe_message}</div>',
-            unsafe_allow_html=True,
-        )
+    body = "".join(
+        f'<div class="validation-message">{html.escape(message, quote=False)}</div>' for message in messages
+    )
+    st.markdown(body, unsafe_allow_html=True)
 
     st.session_state["validation_messages"] = []
 
@@ -120,30 +132,73 @@ def show_notifications() -> None:
     st.session_state["notifications"] = []
 
 
-@st.cache_data(show_spinner=False)
-def get_latest_clients(clients_path: str, file_mtime: float):
-    """Load and deduplicate clients with cache invalidation by mtime."""
-    del file_mtime
+@st.cache_resource(show_spinner=False)
+def file_watcher(file_path: str) -> dict:
+    """Return the shared signature record for a watched file."""
+    del file_path
+    return {"signature": (0, 0.0), "checked_at": float("-inf")}
+
+
+def get_watched_file_signature(file_path: Path) -> Tuple[int, float]:
+    """Return a file's signature, re-reading it at most once per check interval.
+
+    Raises ``FileNotFoundError`` while the file is missing; a missing file is never cached.
+    """
+    watcher = file_watcher(str(file_path))
+    now = time.monotonic()
+    if now - watcher["checked_at"] >= FILE_MTIME_CHECK_SECONDS:
+        try:
+            watcher["signature"] = file_signature(file_path)
+        except FileNotFoundError as exc:
+            raise FileNotFoundError(f"CSV not found: {file_path}") from exc
+        watcher["checked_at"] = now
+    return watcher["signature"]
+
+
+@st.cache_data(show_spinner=False, ttl=DATA_CACHE_TTL_SECONDS)
+def get_latest_clients(clients_path: str, clients_signature: Tuple[int, float]):
+    """Load and deduplicate clients with cache invalidation by file signature."""
+    del clients_signature
     raw_clients = data_loader.load_clients(Path(clients_path))
     return data_loader.deduplicate_latest_clients(raw_clients)
 
 
+@st.cache_data(show_spinner=False, ttl=DATA_CACHE_TTL_SECONDS)
+def get_active_user_inputs(user_inputs_path: str, user_inputs_signature: Tuple[int, float]):
+    """Load active user inputs with cache invalidation by file signature."""
+    del user_inputs_signature
+    user_inputs_df = data_loader.load_user_inputs(Path(user_inputs_path))
+    return data_loader.get_active_user_inputs(user_inputs_df)
+
+
+@st.cache_data(show_spinner=False, ttl=DATA_CACHE_TTL_SECONDS)
+def get_filter_options_cached(
+    _clients_df,
+    clients_signature: Tuple[int, float],
+    columns: Tuple[str, ...],
+):
+    """Build client-dimension filter options, recomputed only when clients.csv changes."""
+    del clients_signature
+    return filter_service.get_filter_options(_clients_df, list(columns))
+
+
 def process_inline_edits(edit_requests: List[dict]) -> Tuple[bool, bool]:
     """Persist inline edit events and report whether any failed validation/save."""
     if not edit_requests:
         return False, False
 
+    edits_df = pd.DataFrame([request["new_values"] for request in edit_requests], columns=EDITABLE_COLUMNS)
+    errors, normalized_df = validation_service.validate_edit_payloads(edits_df)
+
     changed = False
     had_failures = False
-    for request in edit_requests:
+    for request, error_message, normalized_values in zip(
+        edit_requests,
+        errors.tolist(),
+        normalized_df.to_dict(orient="records"),
+    ):
         client_id = request["client_id"]
-        valid, error_message, normalized_values = validation_service.validate_edit_payload(
-            request["new_values"].get("review_date", ""),
-            request["new_values"].get("layer_date", ""),
-            request["new_values"].get("test_date", ""),
-            request["new_values"].get("comment", ""),
-        )
-        if not valid:
+        if error_message:
             queue_validation_message(f"Client {client_id}: {error_message}")
             had_failures = True
             continue
@@ -154,6 +209,7 @@ def process_inline_edits(edit_requests: List[dict]) -> Tuple[bool, bool]:
                 client_id,
                 st.session_state["user_name"],
                 normalized_values,
+                validated=True,
             )
             st.session_state["status_overrides"][str(client_id)] = data_loader.compute_status_label(
                 normalized_values.get("review_date", ""),
@@ -189,33 +245,26 @@ def process_bulk_edit(selected_client_ids: set[str], payload: dict, current_data
         queue_validation_message(error_message or "Bulk payload is invalid.")
         return False
 
-    changed_count = 0
-    skipped_count = 0
-    for client_id in selected_client_ids:
-        row = current_data[current_data["client_id"].astype(str) == str(client_id)]
-        if row.empty:
-            skipped_count += 1
-            continue
+    requested_client_ids = {str(client_id) for client_id in selected_client_ids}
+    editable_client_ids = requested_client_ids & set(current_data["client_id"].astype(str))
 
-        try:
-            entry_id, old_values, new_values = data_loader.persist_user_edit(
-                USER_INPUTS_FILE,
-                str(client_id),
-                st.session_state["user_name"],
-                normalized_values,
-            )
-            audit_service.append_audit_entry(
-                AUDIT_LOG_FILE,
-                entry_id,
-                str(client_id),
-                st.session_state["user_name"],
-                old_values,
-                new_values,
-            )
-            changed_count += 1
-        except Exception as exc:  # pragma: no cover - streamlit runtime guard
-            queue_notification("warning", f"Client {client_id}: Save failed ({exc}).")
+    skipped_count = len(requested_client_ids) - len(editable_client_ids)
+    saved_edits: List[tuple] = []
+    try:
+        saved_edits = data_loader.persist_user_edits_bulk(
+            USER_INPUTS_FILE,
+            [(client_id, normalized_values) for client_id in sorted(editable_client_ids)],
+            st.session_state["user_name"],
+        )
+        audit_service.append_audit_entries(
+            AUDIT_LOG_FILE,
+            saved_edits,
+            st.session_state["user_name"],
+        )
+    except Exception as exc:  # pragma: no cover - streamlit runtime guard
+        queue_notification("warning", f"Bulk edit save failed ({exc}).")
 
+    changed_count = len(saved_edits)
     if changed_count:
         queue_notification("success", f"Bulk edit applied to {changed_count} clients.")
     if skipped_count:
@@ -235,13 +284,10 @@ def main() -> None:
     try:
         data_loader.ensure_data_files(DATA_DIR, USER_INPUTS_FILE, AUDIT_LOG_FILE)
 
-        if not CLIENTS_FILE.exists():
-            st.error(f"CSV not found: {CLIENTS_FILE}")
-            st.stop()
-
-        clients_df = get_latest_clients(str(CLIENTS_FILE), CLIENTS_FILE.stat().st_mtime)
-        user_inputs_df = data_loader.load_user_inputs(USER_INPUTS_FILE)
-        active_inputs_df = data_loader.get_active_user_inputs(user_inputs_df)
+        clients_signature = get_watched_file_signature(CLIENTS_FILE)
+        clients_df = get_latest_clients(str(CLIENTS_FILE), clients_signature)
+        user_inputs_signature = file_signature(USER_INPUTS_FILE)
+        active_inputs_df = get_active_user_inputs(str(USER_INPUTS_FILE), user_inputs_signature)
         merged_df = data_loader.merge_clients_with_user_inputs(clients_df, active_inputs_df)
 
         valid_statuses = set(data_loader.STATUS_LABELS.values())
@@ -252,7 +298,8 @@ def main() -> None:
         }
         st.session_state["status_overrides"] = overrides
         if overrides:
-            persisted_status = merged_df.set_index("client_id")["status"].astype(str).to_dict()
+            # client_id is read as str by load_clients, so no cast is needed here.
+            persisted_status = dict(zip(merged_df["client_id"], merged_df["status"]))
             pending_overrides = {
                 client_id: status
                 for client_id, status in overrides.items()
@@ -260,10 +307,8 @@ def main() -> None:
             }
             st.session_state["status_overrides"] = pending_overrides
             if pending_overrides:
-                merged_df["status"] = merged_df.apply(
-                    lambda row: pending_overrides.get(str(row["client_id"]), row["status"]),
-                    axis=1,
-                )
+                override_mask = merged_df["client_id"].isin(list(pending_overrides))
+                merged_df.loc[override_mask, "status"] = merged_df.loc[override_mask, "client_id"].map(pending_overrides)
     except FileNotFoundError as exc:
         st.error(str(exc))
         st.stop()
@@ -272,7 +317,14 @@ def main() -> None:
         st.stop()
 
     render_navbar(st.session_state["user_name"])
-    filter_options = filter_service.get_filter_options(merged_df, FILTER_COLUMNS)
+    # Client dimensions only change with clients.csv; derived columns such as
+    # status depend on user inputs and today's date, so build those live.
+    client_filter_columns = tuple(column for column in FILTER_COLUMNS if column in clients_df.columns)
+    derived_filter_columns = [column for column in FILTER_COLUMNS if column not in clients_df.columns]
+    filter_options = {
+        **get_filter_options_cached(clients_df, clients_signature, client_filter_columns),
+        **filter_service.get_filter_options(merged_df, derived_filter_columns),
+    }
     selected_filters = render_top_filters(filter_options)
     filter_signature = filter_service.filters_signature(selected_filters)
 
@@ -286,7 +338,9 @@ def main() -> None:
     st.caption(f"Total Rows: {len(filtered_df)}/{len(merged_df)}")
     show_validation_messages()
 
-    if "client_id" in filtered_df.columns:
+    # Clients arrive sorted by client_id from deduplication and filtering keeps
+    # that order, so only sort when the invariant does not hold.
+    if "client_id" in filtered_df.columns and not filtered_df["client_id"].is_monotonic_increasing:
         sorted_df = filtered_df.sort_values(
             by="client_id",
             ascending=True,
@@ -297,7 +351,7 @@ def main() -> None:
         sorted_df = filtered_df
 
     selected_rows, edit_requests, blocked_changes = render_table(
-        sorted_df.copy(),
+        sorted_df,
         set(st.session_state["selected_rows"]),
     )
     st.session_state["selected_rows"] = selected_rows
@@ -8,12 +8,49 @@ from typing import Dict, List, Set, Tuple
 import pandas as pd
 import streamlit as st
 
-from config import TABLE_COLUMNS
-from utils.helpers import normalize_text, parse_date
+from config import EDITABLE_COLUMNS, TABLE_COLUMNS
+from utils.helpers import (
+    format_date_series,
+    normalize_text,
+    normalize_text_series,
+    parse_date,
+    parse_date_series,
+)
 
 
 EditRequest = Dict[str, Dict[str, str]]
 
+STATUS_LEGEND_HTML = """
+<div class="status-legend">
+    <span class="badge badge-missing">🔴 MISSING</span>
+    <span class="badge badge-overdue">🟠 OVERDUE</span>
+    <span class="badge badge-active">🟢 ACTIVE</span>
+</div>
+"""
+
+
+@st.cache_resource(show_spinner=False)
+def _column_config() -> Dict[str, dict]:
+    """Build the data_editor column configuration once per process."""
+    return {
+        "selected": st.column_config.CheckboxColumn(label="", width="small"),
+        "review_date": st.column_config.DateColumn(
+            "review_date",
+            format="YYYY-MM-DD",
+            step=1,
+        ),
+        "layer_date": st.column_config.DateColumn(
+            "layer_date",
+            format="YYYY-MM-DD",
+            step=1,
+        ),
+        "test_date": st.column_config.TextColumn(
+            "test_date",
+            help="Enter date as YYYY-MM-DD",
+        ),
+        "comment": st.column_config.TextColumn("comment"),
+    }
+
 
 def _normalize_date_value(value: object) -> str:
     """Normalize date-like values to YYYY-MM-DD strings."""
@@ -50,47 +87,61 @@ def _normalize_date_value(value: object) -> str:
     return raw_value
 
 
-def _to_editor_date(value: object) -> date | None:
-    """Convert table values to date objects for DateColumn editing."""
-    parsed = parse_date(value)
-    return parsed if parsed is not None else None
+def _normalize_date_series(values: pd.Series) -> pd.Series:
+    """Vectorized form of ``_normalize_date_value`` for a whole column."""
+    parsed = parse_date_series(values)
+    normalized = format_date_series(parsed)
+
+    # Editor dicts and unparseable text are not dates to parse_date; the scalar handles them.
+    fallback_mask = parsed.isna() & values.notna() & (values.astype(str).str.strip() != "")
+    if fallback_mask.any():
+        normalized[fallback_mask] = values[fallback_mask].map(_normalize_date_value)
+    return normalized
+
+
+def _normalized_edit_values(frame: pd.DataFrame) -> pd.DataFrame:
+    """Normalize only the editable columns of a frame for diffing, indexed by client_id."""
+    values = pd.DataFrame(index=pd.Index(frame["client_id"].astype(str), name="client_id"))
+    for column in EDITABLE_COLUMNS:
+        column_values = frame[column] if column in frame.columns else pd.Series("", index=frame.index)
+        if column in ("review_date", "layer_date"):
+            normalized = _normalize_date_series(column_values)
+        else:
+            normalized = normalize_text_series(column_values)
+        values[column] = normalized.to_numpy()
+    return values
 
 
 def render_table(page_df: pd.DataFrame, selected_client_ids: Set[str]) -> Tuple[Set[str], List[dict], List[str]]:
-    """Render editable table and capture row selection plus inline cell edits."""
+    """Render editable table and capture row selection plus inline cell edits.
+
+    ``page_df`` is treated as read-only; only the table columns are copied out of it.
+    """
     if page_df.empty:
         st.info("No rows available.")
         return selected_client_ids, [], []
 
-    original_df = page_df.copy().reset_index(drop=True)
+    table_columns = [column for column in TABLE_COLUMNS if column in page_df.columns]
+    original_df = page_df[table_columns].reset_index(drop=True)
     original_df["client_id"] = original_df["client_id"].astype(str)
 
     for column in ("review_date", "layer_date"):
         if column in original_df.columns:
-            original_df[column] = original_df[column].apply(_normalize_date_value)
-    if "test_date" in original_df.columns:
-        original_df["test_date"] = original_df["test_date"].apply(normalize_text)
-
-    working_df = original_df.copy()
-    working_df["selected"] = working_df["client_id"].isin(selected_client_ids)
+            original_df[column] = _normalize_date_series(original_df[column])
+    for column in ("test_date", "comment"):
+        if column in original_df.columns:
+            original_df[column] = normalize_text_series(original_df[column])
 
+    editor_columns = {"selected": original_df["client_id"].isin(selected_client_ids)}
     for column in ("review_date", "layer_date"):
-        if column in working_df.columns:
-            working_df[column] = working_df[column].apply(_to_editor_date)
+        if column in original_df.columns:
+            editor_columns[column] = parse_date_series(original_df[column])
+    working_df = original_df.assign(**editor_columns)
 
     display_columns = [column for column in TABLE_COLUMNS if column in working_df.columns]
-    display_df = working_df[display_columns].copy()
-
-    st.markdown(
-        """
-        <div class="status-legend">
-            <span class="badge badge-missing">🔴 MISSING</span>
-            <span class="badge badge-overdue">🟠 OVERDUE</span>
-            <span class="badge badge-active">🟢 ACTIVE</span>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    display_df = working_df[display_columns]
+
+    st.markdown(STATUS_LEGEND_HTML, unsafe_allow_html=True)
 
     editable_columns = ["selected", "review_date", "layer_date", "test_date", "comment"]
     disabled_columns = [column for column in display_columns if column not in editable_columns]
@@ -103,24 +154,8 @@ def render_table(page_df: pd.DataFrame, selected_client_ids: Set[str]) -> Tuple[
         num_rows="fixed",
         column_order=display_columns,
         disabled=disabled_columns,
-        column_config={
-            "selected": st.column_config.CheckboxColumn(label="", width="small"),
-            "review_date": st.column_config.DateColumn(
-                "review_date",
-                format="YYYY-MM-DD",
-                step=1,
-            ),
-            "layer_date": st.column_config.DateColumn(
-                "layer_date",
-                format="YYYY-MM-DD",
-                step=1,
-            ),
-            "test_date": st.column_config.TextColumn(
-                "test_date",
-                help="Enter date as YYYY-MM-DD",
-            ),
-            "comment": st.column_config.TextColumn("comment"),
-        },
+        # Copy the per-column configs; data_editor updates them in place.
+        column_config={column: dict(config) for column, config in _column_config().items()},
     )
 
     if not isinstance(edited_df, pd.DataFrame):
@@ -128,37 +163,33 @@ def render_table(page_df: pd.DataFrame, selected_client_ids: Set[str]) -> Tuple[
     if edited_df.empty:
         return set(), [], []
 
-    edited_df["client_id"] = edited_df["client_id"].astype(str)
-    updated_selected = set(
-        edited_df.loc[edited_df["selected"].astype(bool), "client_id"].astype(str).tolist()
-    )
+    selected_mask = edited_df["selected"].fillna(False).to_numpy(dtype=bool)
+    updated_selected = set(edited_df["client_id"].astype(str).to_numpy()[selected_mask].tolist())
 
-    original_by_client = original_df.set_index("client_id").to_dict(orient="index")
     edit_requests: List[dict] = []
     blocked_changes: List[str] = []
 
-    for _, row in edited_df.iterrows():
-        client_id = str(row.get("client_id", ""))
-        if client_id not in original_by_client:
-            continue
-
-        original_row = original_by_client[client_id]
-        old_values = {
-            "review_date": _normalize_date_value(original_row.get("review_date", "")),
-            "layer_date": _normalize_date_value(original_row.get("layer_date", "")),
-            "test_date": normalize_text(original_row.get("test_date", "")),
-            "comment": normalize_text(original_row.get("comment", "")),
-        }
-        new_values = {
-            "review_date": _normalize_date_value(row.get("review_date", "")),
-            "layer_date": _normalize_date_value(row.get("layer_date", "")),
-            "test_date": normalize_text(row.get("test_date", "")),
-            "comment": normalize_text(row.get("comment", "")),
-        }
-
-        if old_values == new_values:
-            continue
-
-        edit_requests.append({"client_id": client_id, "old_values": old_values, "new_values": new_values})
+    # original_df is already normalized above; only the editor output needs it.
+    old_values_df = original_df.reindex(columns=EDITABLE_COLUMNS, fill_value="").set_index(
+        pd.Index(original_df["client_id"], name="client_id")
+    )
+    old_values_df = old_values_df[~old_values_df.index.duplicated(keep="last")]
+    new_values_df = _normalized_edit_values(edited_df)
+    new_values_df = new_values_df[new_values_df.index.isin(old_values_df.index)]
+    old_values_df = old_values_df.reindex(new_values_df.index)
+
+    changed_mask = (new_values_df != old_values_df).any(axis=1)
+    for client_id, old_row, new_row in zip(
+        new_values_df.index[changed_mask],
+        old_values_df[changed_mask].itertuples(index=False, name=None),
+        new_values_df[changed_mask].itertuples(index=False, name=None),
+    ):
+        edit_requests.append(
+            {
+                "client_id": client_id,
+                "old_values": dict(zip(EDITABLE_COLUMNS, old_row)),
+                "new_values": dict(zip(EDITABLE_COLUMNS, new_row)),
+            }
+        )
 
     return updated_selected, edit_requests, blocked_changes
@@ -16,6 +16,8 @@ DATE_FORMAT = "%Y-%m-%d"
 REVIEW_OVERDUE_MONTHS = 12
 DEFAULT_PAGE_SIZE = 50
 PAGE_SIZE_OPTIONS = [25, 50, 100, 200]
+FILE_MTIME_CHECK_SECONDS = 2.0
+DATA_CACHE_TTL_SECONDS = 24 * 60 * 60
 
 ALLOWED_TAGS = {"G", "U", "P"}
 
@@ -33,6 +35,9 @@ REQUIRED_CLIENT_COLUMNS = [
     "layer",
 ]
 
+# Low-cardinality client dimensions stored as pandas categoricals.
+CATEGORICAL_CLIENT_COLUMNS = ["tag", "region", "region1", "region2", "pod", "CA", "RM"]
+
 USER_INPUT_COLUMNS = [
     "entry_id",
     "client_id",
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import csv
 import json
 from pathlib import Path
+from typing import Iterable, Tuple
 from uuid import uuid4
 
 import pandas as pd
 
 from config import AUDIT_COLUMNS
-from utils.helpers import atomic_write_dataframe, file_lock, iso_now, read_csv_or_empty
+from utils.helpers import atomic_write_dataframe, file_lock, iso_now
 
 
 def ensure_audit_file(audit_file: Path) -> None:
@@ -29,18 +31,39 @@ def append_audit_entry(
     new_values: dict,
 ) -> None:
     """Append one audit event with old/new payloads."""
-    ensure_audit_file(audit_file)
+    append_audit_entries(audit_file, [(entry_id, client_id, old_values, new_values)], changed_by)
 
-    with file_lock(audit_file):
-        audit_df = read_csv_or_empty(audit_file, AUDIT_COLUMNS)
-        new_row = {
+
+def append_audit_entries(
+    audit_file: Path,
+    entries: Iterable[Tuple[str, str, dict, dict]],
+    changed_by: str,
+) -> None:
+    """Append ``(entry_id, client_id, old_values, new_values)`` events in one write."""
+    timestamp = iso_now()
+    new_rows = [
+        {
             "audit_id": str(uuid4()),
             "entry_id": entry_id,
             "client_id": str(client_id),
             "changed_by": changed_by,
-            "change_timestamp": iso_now(),
+            "change_timestamp": timestamp,
             "old_values": json.dumps(old_values, ensure_ascii=True),
             "new_values": json.dumps(new_values, ensure_ascii=True),
         }
-        updated_df = pd.concat([audit_df, pd.DataFrame([new_row])], ignore_index=True)
-        atomic_write_dataframe(updated_df[AUDIT_COLUMNS], audit_file)
+        for entry_id, client_id, old_values, new_values in entries
+    ]
+    if not new_rows:
+        return
+
+    ensure_audit_file(audit_file)
+
+    # The audit log is append-only, so write new lines instead of rewriting the file. Every
+    # field is quoted, matching the style atomic_write_dataframe uses for the header.
+    with file_lock(audit_file):
+        write_header = audit_file.stat().st_size == 0
+        with audit_file.open("a", newline="", encoding="utf-8") as audit_handle:
+            writer = csv.writer(audit_handle, lineterminator="\n", quoting=csv.QUOTE_ALL)
+            if write_header:
+                writer.writerow(AUDIT_COLUMNS)
+            writer.writerows([row[column] for column in AUDIT_COLUMNS] for row in new_rows)
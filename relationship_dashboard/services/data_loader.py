@@ -2,16 +2,38 @@
 
 from __future__ import annotations
 
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Iterable, List, Tuple
 from uuid import uuid4
 
+import numpy as np
 import pandas as pd
 from dateutil.relativedelta import relativedelta
 
-from config import ALLOWED_TAGS, AUDIT_COLUMNS, REQUIRED_CLIENT_COLUMNS, USER_INPUT_COLUMNS
+from config import (
+    ALLOWED_TAGS,
+    AUDIT_COLUMNS,
+    CATEGORICAL_CLIENT_COLUMNS,
+    EDITABLE_COLUMNS,
+    REQUIRED_CLIENT_COLUMNS,
+    REVIEW_OVERDUE_MONTHS,
+    USER_INPUT_COLUMNS,
+)
 from services import validation_service
-from utils.helpers import atomic_write_dataframe, file_lock, iso_now, parse_date, read_csv_or_empty
+from utils.helpers import (
+    atomic_write_dataframe,
+    file_lock,
+    iso_now,
+    normalize_text,
+    parse_date,
+    parse_date_series,
+    read_csv_as_text,
+    read_csv_or_empty,
+)
+
+TRUE_VALUES = {"true", "1", "yes"}
 
 STATUS_LABELS = {
     "MISSING": "🔴 MISSING",
@@ -19,6 +41,12 @@ STATUS_LABELS = {
     "ACTIVE": "🟢 ACTIVE",
 }
 
+# Status labels indexed by the integer codes used on the vectorized path.
+_STATUS_LABEL_ARRAY = np.array(
+    [STATUS_LABELS["MISSING"], STATUS_LABELS["OVERDUE"], STATUS_LABELS["ACTIVE"]],
+    dtype=object,
+)
+
 
 def ensure_data_files(data_dir: Path, user_inputs_file: Path, audit_file: Path) -> None:
     """Ensure data directory and writable CSV files exist."""
@@ -36,7 +64,7 @@ def load_clients(clients_file: Path) -> pd.DataFrame:
     if not clients_file.exists():
         raise FileNotFoundError(f"Missing required file: {clients_file}")
 
-    dataframe = pd.read_csv(clients_file, dtype=str).fillna("")
+    dataframe = read_csv_as_text(clients_file)
     for column in REQUIRED_CLIENT_COLUMNS:
         if column not in dataframe.columns:
             dataframe[column] = ""
@@ -47,6 +75,8 @@ def load_clients(clients_file: Path) -> pd.DataFrame:
 
     # Keep only exact tag matches from the business whitelist.
     dataframe = dataframe[dataframe["tag"].isin(ALLOWED_TAGS)].copy()
+    for column in CATEGORICAL_CLIENT_COLUMNS:
+        dataframe[column] = dataframe[column].astype("category")
     return dataframe
 
 
@@ -58,40 +88,56 @@ def deduplicate_latest_clients(dataframe: pd.DataFrame) -> pd.DataFrame:
     working_df = dataframe.copy()
     working_df["_review_caw_dt"] = pd.to_datetime(working_df["review_cawb"], errors="coerce")
 
-    def pick_latest_row(group: pd.DataFrame) -> int:
-        dated_rows = group[group["_review_caw_dt"].notna()]
-        if not dated_rows.empty:
-            max_date = dated_rows["_review_caw_dt"].max()
-            max_rows = dated_rows[dated_rows["_review_caw_dt"] == max_date]
-            return int(max_rows["_row_order"].idxmax())
-        return int(group["_row_order"].idxmax())
+    working_df["_has_caw_dt"] = working_df["_review_caw_dt"].notna()
 
-    latest_indexes = working_df.groupby("client_id", sort=False).apply(pick_latest_row)
-    latest_df = working_df.loc[latest_indexes.tolist()].copy()
+    # Prefer rows with a CAW date, then the latest date, then the last row in the file.
+    latest_df = (
+        working_df.sort_values(
+            ["_has_caw_dt", "_review_caw_dt", "_row_order"],
+            ascending=False,
+            kind="mergesort",
+        )
+        .drop_duplicates("client_id", keep="first")
+        .copy()
+    )
 
     # Always display CAW and region fields from the last occurrence in the file.
     last_occurrence = (
-        working_df.sort_values("_row_order")
-        .groupby("client_id", as_index=False)
-        .tail(1)
+        working_df.sort_values("_row_order", kind="mergesort")
+        .drop_duplicates("client_id", keep="last")
         [["client_id", "review_cawb", "region", "region1", "region2"]]
     )
 
     latest_df = latest_df.drop(columns=["review_cawb", "region", "region1", "region2"], errors="ignore")
     latest_df = latest_df.merge(last_occurrence, on="client_id", how="left")
 
-    latest_df = latest_df.drop(columns=["_review_caw_dt"], errors="ignore")
-    latest_df = latest_df.sort_values("client_id").reset_index(drop=True)
+    latest_df = latest_df.drop(columns=["_review_caw_dt", "_has_caw_dt"], errors="ignore")
+    latest_df = latest_df.sort_values("client_id", kind="mergesort", ignore_index=True)
     return latest_df
 
 
+def _parse_bool_column(values: pd.Series) -> pd.Series:
+    """Parse a CSV flag column ("true", "1" or "yes", any case) into booleans."""
+    text_values = values.fillna("").astype(str)
+    # Flag columns hold a handful of distinct strings, so decide each one once.
+    lookup = {value: value.lower() in TRUE_VALUES for value in text_values.unique()}
+    return text_values.map(lookup).astype(bool)
+
+
 def load_user_inputs(user_inputs_file: Path) -> pd.DataFrame:
     """Load user inputs file and normalize expected schema."""
     dataframe = read_csv_or_empty(user_inputs_file, USER_INPUT_COLUMNS)
-    dataframe["is_active"] = dataframe["is_active"].astype(str).str.lower().isin(["true", "1", "yes"])
+    dataframe["is_active"] = _parse_bool_column(dataframe["is_active"])
     return dataframe
 
 
+def _latest_rows_by_client(user_inputs_df: pd.DataFrame) -> pd.DataFrame:
+    """Return the latest row per client by change_timestamp; later file rows win ties."""
+    # ISO timestamps compare lexicographically, so idxmax needs no parsing.
+    latest_indexes = user_inputs_df.iloc[::-1].groupby("client_id")["change_timestamp"].idxmax()
+    return user_inputs_df.loc[latest_indexes]
+
+
 def get_active_user_inputs(user_inputs_df: pd.DataFrame) -> pd.DataFrame:
     """Return one active entry per client, preferring the latest timestamp."""
     if user_inputs_df.empty:
@@ -105,11 +151,7 @@ def get_active_user_inputs(user_inputs_df: pd.DataFrame) -> pd.DataFrame:
             columns=["client_id", "entry_id", "review_date", "layer_date", "test_date", "comment"]
         )
 
-    active_df = (
-        active_df.sort_values(["client_id", "change_timestamp"])  # ISO timestamps sort lexicographically.
-        .groupby("client_id", as_index=False)
-        .tail(1)
-    )
+    active_df = _latest_rows_by_client(active_df)
     return active_df[["client_id", "entry_id", "review_date", "layer_date", "test_date", "comment"]]
 
 
@@ -119,13 +161,33 @@ def _compute_status(review_date: str) -> str:
     if parsed_review is None:
         return "MISSING"
 
-    overdue_cutoff = pd.Timestamp.today().date() - relativedelta(months=12)
-    if parsed_review <= overdue_cutoff:
+    if parsed_review <= _overdue_cutoff():
         return "OVERDUE"
 
     return "ACTIVE"
 
 
+@lru_cache(maxsize=1)
+def _overdue_cutoff_for(today_ordinal: int) -> date:
+    """Return the overdue cutoff for the given day, cached until the date rolls over."""
+    return date.fromordinal(today_ordinal) - relativedelta(months=REVIEW_OVERDUE_MONTHS)
+
+
+def _overdue_cutoff() -> date:
+    """Return the latest review date that counts as overdue today."""
+    return _overdue_cutoff_for(date.today().toordinal())
+
+
+def _compute_status_labels(review_dates: pd.Series) -> pd.Series:
+    """Vectorized status labels for a column of review dates."""
+    parsed = parse_date_series(review_dates.fillna("").astype(str))
+    known = parsed.notna()
+    cutoff = _overdue_cutoff()
+    overdue = known & (parsed.where(known, cutoff) <= cutoff)
+    status_codes = np.where(known, np.where(overdue, 1, 2), 0)
+    return pd.Series(_STATUS_LABEL_ARRAY[status_codes], index=review_dates.index, dtype=object)
+
+
 def compute_status_label(review_date: object) -> str:
     """Return the display label for a status derived from review-date rules."""
     return STATUS_LABELS[_compute_status(str(review_date))]
@@ -139,10 +201,7 @@ def merge_clients_with_user_inputs(clients_df: pd.DataFrame, active_inputs_df: p
     for column in ["review_date", "layer_date", "test_date", "comment", "active_entry_id"]:
         merged_df[column] = merged_df[column].fillna("")
 
-    merged_df["status"] = merged_df.apply(
-        lambda row: STATUS_LABELS[_compute_status(str(row["review_date"]))],
-        axis=1,
-    )
+    merged_df["status"] = _compute_status_labels(merged_df["review_date"])
 
     merged_df["selected"] = False
     return merged_df
@@ -153,57 +212,101 @@ def persist_user_edit(
     client_id: str,
     changed_by: str,
     new_values: Dict[str, str],
+    validated: bool = False,
 ) -> Tuple[str, Dict[str, str], Dict[str, str]]:
     """Deactivate prior active row and append a new active user input entry."""
-    valid, error_message, normalized_values = validation_service.validate_edit_payload(
-        new_values.get("review_date", ""),
-        new_values.get("layer_date", ""),
-        new_values.get("test_date", ""),
-        new_values.get("comment", ""),
-    )
-    if not valid:
-        raise ValueError(error_message or "Invalid edit payload.")
+    entry_id, _, old_values, normalized_values = persist_user_edits_bulk(
+        user_inputs_file,
+        [(client_id, new_values)],
+        changed_by,
+        validated=validated,
+    )[0]
+    return entry_id, old_values, normalized_values
+
+
+def persist_user_edits_bulk(
+    user_inputs_file: Path,
+    edits: Iterable[Tuple[str, Dict[str, str]]],
+    changed_by: str,
+    validated: bool = False,
+) -> List[Tuple[str, str, Dict[str, str], Dict[str, str]]]:
+    """Persist many client edits with a single lock and rewrite of the inputs file.
+
+    Each edit is a ``(client_id, values)`` pair; client ids must be unique within
+    one call, otherwise ``ValueError`` is raised. Pass ``validated=True`` when the
+    values are already normalized by validation_service to skip re-validating them.
+    Returns ``(entry_id, client_id, old_values, new_values)`` per edit.
+    """
+    edits = list(edits)
+    if not edits:
+        return []
+
+    # Two edits for one client would both be written as active rows.
+    seen_client_ids = set()
+    for client_id, _ in edits:
+        if str(client_id) in seen_client_ids:
+            raise ValueError(f"Duplicate edit for client {client_id} in one save.")
+        seen_client_ids.add(str(client_id))
+
+    # Bulk edits repeat one payload for every client, so each distinct payload is validated once.
+    normalized_by_payload: Dict[Tuple[str, ...], Dict[str, str]] = {}
+    normalized_edits = []
+    for client_id, new_values in edits:
+        if validated:
+            normalized_edits.append((str(client_id), dict(new_values)))
+            continue
+        payload = tuple(normalize_text(new_values.get(column, "")) for column in EDITABLE_COLUMNS)
+        if payload not in normalized_by_payload:
+            valid, error_message, normalized_values = validation_service.validate_edit_payload(*payload)
+            if not valid:
+                raise ValueError(error_message or "Invalid edit payload.")
+            normalized_by_payload[payload] = normalized_values
+        normalized_edits.append((str(client_id), normalized_by_payload[payload]))
 
     with file_lock(user_inputs_file):
         user_inputs_df = read_csv_or_empty(user_inputs_file, USER_INPUT_COLUMNS)
-        user_inputs_df["is_active"] = user_inputs_df["is_active"].astype(str).str.lower().isin(["true", "1", "yes"])
+        user_inputs_df["is_active"] = _parse_bool_column(user_inputs_df["is_active"])
 
-        client_mask = user_inputs_df["client_id"] == str(client_id)
+        client_mask = user_inputs_df["client_id"].isin([client_id for client_id, _ in normalized_edits])
         active_mask = client_mask & user_inputs_df["is_active"]
 
-        old_values = {"review_date": "", "layer_date": "", "test_date": "", "comment": ""}
-        previous_entry_id = ""
-
-        if active_mask.any():
-            active_rows = user_inputs_df[active_mask].copy()
-            active_rows = active_rows.sort_values("change_timestamp")
-            previous_active = active_rows.iloc[-1]
-            previous_entry_id = str(previous_active.get("entry_id", ""))
-            old_values = {
-                "review_date": str(previous_active.get("review_date", "")),
-                "layer_date": str(previous_active.get("layer_date", "")),
-                "test_date": str(previous_active.get("test_date", "")),
-                "comment": str(previous_active.get("comment", "")),
-            }
+        latest_active_df = _latest_rows_by_client(user_inputs_df[active_mask])
+        previous_active_by_client = {
+            str(client_id): (str(entry_id), dict(zip(EDITABLE_COLUMNS, map(str, values))))
+            for client_id, entry_id, *values in latest_active_df[
+                ["client_id", "entry_id", *EDITABLE_COLUMNS]
+            ].itertuples(index=False, name=None)
+        }
 
         user_inputs_df.loc[active_mask, "is_active"] = False
 
-        entry_id = str(uuid4())
         timestamp = iso_now()
-        new_row = {
-            "entry_id": entry_id,
-            "client_id": str(client_id),
-            "review_date": normalized_values.get("review_date", ""),
-            "layer_date": normalized_values.get("layer_date", ""),
-            "test_date": normalized_values.get("test_date", ""),
-            "comment": normalized_values.get("comment", ""),
-            "changed_by": changed_by,
-            "change_timestamp": timestamp,
-            "is_active": True,
-            "previous_entry_id": previous_entry_id,
-        }
-
-        updated_df = pd.concat([user_inputs_df, pd.DataFrame([new_row])], ignore_index=True)
+        new_rows = []
+        saved_edits = []
+        for client_id, normalized_values in normalized_edits:
+            previous_entry_id, old_values = previous_active_by_client.get(
+                client_id,
+                ("", {"review_date": "", "layer_date": "", "test_date": "", "comment": ""}),
+            )
+
+            entry_id = str(uuid4())
+            new_rows.append(
+                {
+                    "entry_id": entry_id,
+                    "client_id": client_id,
+                    "review_date": normalized_values.get("review_date", ""),
+                    "layer_date": normalized_values.get("layer_date", ""),
+                    "test_date": normalized_values.get("test_date", ""),
+                    "comment": normalized_values.get("comment", ""),
+                    "changed_by": changed_by,
+                    "change_timestamp": timestamp,
+                    "is_active": True,
+                    "previous_entry_id": previous_entry_id,
+                }
+            )
+            saved_edits.append((entry_id, client_id, old_values, normalized_values))
+
+        updated_df = pd.concat([user_inputs_df, pd.DataFrame(new_rows)], ignore_index=True)
         atomic_write_dataframe(updated_df[USER_INPUT_COLUMNS], user_inputs_file)
 
-    return entry_id, old_values, normalized_values
+    return saved_edits
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Dict, List
 
+import numpy as np
 import pandas as pd
 
 
@@ -14,21 +15,27 @@ def get_filter_options(dataframe: pd.DataFrame, columns: List[str]) -> Dict[str,
         if column not in dataframe.columns:
             options[column] = []
             continue
-        values = [value for value in dataframe[column].astype(str).tolist() if value.strip()]
-        options[column] = sorted(set(values))
+        if isinstance(dataframe[column].dtype, pd.CategoricalDtype):
+            # Categories are already unique; only drop the ones no row uses anymore.
+            values = dataframe[column].cat.remove_unused_categories().cat.categories.astype(str).tolist()
+        else:
+            values = dataframe[column].astype(str).unique().tolist()
+        options[column] = sorted({value for value in values if value.strip()})
     return options
 
 
 def apply_filters(dataframe: pd.DataFrame, selected_filters: Dict[str, List[str]]) -> pd.DataFrame:
     """Apply AND logic across filter dimensions with OR inside each dimension."""
-    filtered = dataframe
+    mask = np.ones(len(dataframe), dtype=bool)
     for column, values in selected_filters.items():
-        if not values or column not in filtered.columns:
+        if not values or column not in dataframe.columns:
             continue
-        filtered = filtered[filtered[column].isin(values)]
-    return filtered
+        mask &= dataframe[column].isin(values).to_numpy(dtype=bool)
+    if mask.all():
+        return dataframe
+    return dataframe[mask]
 
 
-def filters_signature(selected_filters: Dict[str, List[str]]) -> tuple:
-    """Build a hashable signature used to detect filter changes."""
-    return tuple((key, tuple(sorted(values))) for key, values in sorted(selected_filters.items()))
+def filters_signature(selected_filters: Dict[str, List[str]]) -> frozenset:
+    """Build an order-insensitive hashable signature used to detect filter changes."""
+    return frozenset((key, frozenset(values)) for key, values in selected_filters.items() if values)
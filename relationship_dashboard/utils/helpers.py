@@ -2,31 +2,111 @@
 
 from __future__ import annotations
 
+import csv
 import getpass
 import os
 import re
 import tempfile
 import time
 from contextlib import contextmanager
-from datetime import date, datetime
+from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Generator, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; file_lock falls back to lockfile creation.
+    fcntl = None
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # Optional; CSV reads and writes fall back to the pandas C engine.
+    pa = None
+
+try:
+    from ciso8601 import parse_datetime as parse_iso_datetime
+except ImportError:  # Optional C parser; strptime handles ISO dates without it.
+    parse_iso_datetime = None
+
+DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%m/%d/%Y", "%m-%d-%Y")
+
+# Inferred column types whose str() form already matches normalize_text.
+TEXT_LIKE_INFERRED_TYPES = {"string", "empty", "integer", "floating", "mixed-integer-float", "boolean"}
+
+# Column types _write_csv_arrow formats exactly like DataFrame.to_csv.
+ARROW_CSV_INFERRED_TYPES = {"string", "empty", "boolean"}
+
+# Each format is identified by its leading digit run and first separator, so at most one is tried.
+DATE_LAYOUT_PATTERN = re.compile(r"(\d+)([-/])")
+DATE_FORMAT_BY_LAYOUT = {
+    (4, "-"): "%Y-%m-%d",
+    (4, "/"): "%Y/%m/%d",
+    (1, "/"): "%m/%d/%Y",
+    (2, "/"): "%m/%d/%Y",
+    (1, "-"): "%m-%d-%Y",
+    (2, "-"): "%m-%d-%Y",
+}
+
+# Lock retries back off exponentially so short critical sections are not padded by a fixed sleep.
+LOCK_RETRY_INITIAL_SECONDS = 0.0001
+LOCK_RETRY_MAX_SECONDS = 0.01
+
+# Written into lockfiles to identify the holder; refreshed in forked children.
+_PID_BYTES = str(os.getpid()).encode("utf-8")
+
+
+def _refresh_pid_bytes() -> None:
+    """Recompute the cached pid after a fork."""
+    global _PID_BYTES
+    _PID_BYTES = str(os.getpid()).encode("utf-8")
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_refresh_pid_bytes)
+
+# Partial dates: "YYYY-M", "YYYY" or "M"; the matched group name tells them apart.
+PARTIAL_DATE_PATTERN = re.compile(
+    r"^(?:(?P<year>\d{4})-(?P<month>\d{1,2})|(?P<year_only>\d{4})|(?P<month_only>\d{1,2}))$"
+)
+
+
+@lru_cache(maxsize=1)
 def get_current_username() -> str:
-    """Return the current system username with a safe fallback."""
+    """Return the current system username with a safe fallback; looked up once per process."""
     try:
         return os.getlogin()
     except OSError:
         return getpass.getuser() or "unknown"
 
 
+# Exact-type handlers for the common cases; a dict lookup avoids the isinstance/pd.isna chain.
+# Plain Python scalars never need pd.isna: NaN is the only null float and compares unequal to itself.
+# Timestamps keep their full isoformat, as they did via the datetime check below.
+_NORMALIZE_TEXT_BY_TYPE = {
+    str: str.strip,
+    type(None): lambda value: "",
+    float: lambda value: "" if value != value else str(value),
+    int: str,
+    bool: str,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    pd.Timestamp: pd.Timestamp.isoformat,
+    pd.Timedelta: lambda value: "",
+}
+
+
 def normalize_text(value: object) -> str:
     """Normalize a value into a stripped string, or empty string for nulls."""
-    if value is None:
-        return ""
+    handler = _NORMALIZE_TEXT_BY_TYPE.get(type(value))
+    if handler is not None:
+        return handler(value)
+
+    # Only numpy/pandas scalars and other non-builtin types reach pd.isna.
     try:
         if pd.isna(value):
             return ""
@@ -41,6 +121,22 @@ def normalize_text(value: object) -> str:
     return str(value).strip()
 
 
+def normalize_text_series(values: pd.Series) -> pd.Series:
+    """Normalize a column into stripped strings, with empty strings for nulls.
+
+    Text, numeric and boolean columns match ``normalize_text`` value for value and
+    should use this instead of ``.map(normalize_text)``. Datetime columns are the
+    exception: they are formatted as ``YYYY-MM-DD`` dates, not full isoformat.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return format_date_series(parse_date_series(values))
+    if pd.api.types.infer_dtype(values, skipna=True) in TEXT_LIKE_INFERRED_TYPES:
+        # Going through object first lets nullable Int64/boolean columns accept the "" fill.
+        return values.astype(object).fillna("").astype(str).str.strip()
+    # Mixed object columns (dates, dicts, ...) keep the scalar rules.
+    return values.map(normalize_text)
+
+
 def parse_date(value: object) -> Optional[date]:
     """Parse date-like values into date objects, supporting partial inputs."""
     if isinstance(value, pd.Timestamp):
@@ -56,28 +152,79 @@ def parse_date(value: object) -> Optional[date]:
     if not raw_value:
         return None
 
-    for date_format in ("%Y-%m-%d", "%Y/%m/%d", "%m/%d/%Y", "%m-%d-%Y"):
+    # Month-only input resolves against the current year, so it stays out of the cache.
+    partial_match = PARTIAL_DATE_PATTERN.match(raw_value)
+    if partial_match and partial_match.lastgroup == "month_only":
+        month = int(partial_match.group("month_only"))
+        if 1 <= month <= 12:
+            return date(date.today().year, month, 1)
+        return None
+
+    return _parse_date_text(raw_value)
+
+
+def parse_date_series(values: pd.Series) -> pd.Series:
+    """Vectorized ``parse_date`` for a column; returns date objects or None."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        parsed_dates = values.dt.date.astype(object)
+        return parsed_dates.where(values.notna(), None)
+
+    if pd.api.types.infer_dtype(values, skipna=True) in ("string", "empty"):
+        is_text = values.notna().to_numpy()
+    else:
+        is_text = values.map(type).eq(str).to_numpy()
+    text = values.where(is_text, "").astype(str).str.strip()
+    result = pd.Series(np.full(len(values), None, dtype=object), index=values.index)
+    remaining = (text != "").to_numpy()
+    for date_format in DATE_FORMATS:
+        if not remaining.any():
+            break
+        parsed = pd.to_datetime(text[remaining], format=date_format, errors="coerce")
+        parsed_mask = remaining.copy()
+        # Year 0 parses in pandas but has no datetime.date; leave it to the scalar rules.
+        parsed_mask[remaining] = (parsed.notna() & (parsed.dt.year >= 1)).to_numpy()
+        result[parsed_mask] = parsed[parsed_mask[remaining]].dt.date.to_numpy()
+        remaining = remaining & ~parsed_mask
+
+    # Partial dates, out-of-range years and non-string values keep the scalar rules.
+    fallback_mask = remaining | ~is_text
+    if fallback_mask.any():
+        result[fallback_mask] = values[fallback_mask].map(parse_date)
+    return result
+
+
+def format_date_series(dates: pd.Series) -> pd.Series:
+    """Format date objects from ``parse_date_series`` as YYYY-MM-DD, with "" for None."""
+    # date.isoformat zero-pads years below 1000, which dt.strftime does not.
+    return dates.map(date.isoformat, na_action="ignore").fillna("").astype(object)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_text(raw_value: str) -> Optional[date]:
+    """Parse a normalized date string; cached since date columns repeat values heavily."""
+    if parse_iso_datetime is not None and len(raw_value) == 10 and raw_value[4] == raw_value[7] == "-":
         try:
-            return datetime.strptime(raw_value, date_format).date()
+            return parse_iso_datetime(raw_value).date()
         except ValueError:
             pass
 
-    year_month_match = re.match(r"^(\d{4})-(\d{1,2})$", raw_value)
-    if year_month_match:
-        year = int(year_month_match.group(1))
-        month = int(year_month_match.group(2))
-        if 1 <= month <= 12:
-            return date(year, month, 1)
-
-    year_only_match = re.match(r"^(\d{4})$", raw_value)
-    if year_only_match:
-        return date(int(year_only_match.group(1)), 1, 1)
+    layout_match = DATE_LAYOUT_PATTERN.match(raw_value)
+    if layout_match:
+        date_format = DATE_FORMAT_BY_LAYOUT.get((len(layout_match.group(1)), layout_match.group(2)))
+        if date_format is not None:
+            try:
+                return datetime.strptime(raw_value, date_format).date()
+            except ValueError:
+                pass
 
-    month_only_match = re.match(r"^(\d{1,2})$", raw_value)
-    if month_only_match:
-        month = int(month_only_match.group(1))
-        if 1 <= month <= 12:
-            return date(date.today().year, month, 1)
+    partial_match = PARTIAL_DATE_PATTERN.match(raw_value)
+    if partial_match:
+        if partial_match.lastgroup == "year_only":
+            return date(int(partial_match.group("year_only")), 1, 1)
+        if partial_match.lastgroup == "month":
+            month = int(partial_match.group("month"))
+            if 1 <= month <= 12:
+                return date(int(partial_match.group("year")), month, 1)
 
     try:
         return datetime.fromisoformat(raw_value).date()
@@ -85,16 +232,66 @@ def parse_date(value: object) -> Optional[date]:
         return None
 
 
+# (epoch second, formatted timestamp) of the last iso_now call; racing threads just recompute it.
+_last_iso_now: Tuple[int, str] = (-1, "")
+
+
 def iso_now() -> str:
-    """Return current UTC timestamp in ISO-8601 format."""
-    return datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    """Return current UTC timestamp in ISO-8601 format, formatted at most once per second."""
+    global _last_iso_now
+    now_seconds = int(time.time())
+    cached_seconds, cached_value = _last_iso_now
+    if cached_seconds == now_seconds:
+        return cached_value
+
+    value = datetime.fromtimestamp(now_seconds, timezone.utc).replace(tzinfo=None).isoformat() + "Z"
+    _last_iso_now = (now_seconds, value)
+    return value
 
 
 @contextmanager
 def file_lock(file_path: Path, timeout_seconds: float = 10.0) -> Generator[None, None, None]:
-    """Acquire an exclusive lock using lockfile creation."""
+    """Acquire an exclusive lock on a sidecar lockfile next to ``file_path``."""
     lock_path = file_path.with_suffix(file_path.suffix + ".lock")
+    if fcntl is None:
+        with _exclusive_create_lock(file_path, lock_path, timeout_seconds):
+            yield
+        return
+
+    deadline = time.monotonic() + timeout_seconds
+    fd = os.open(str(lock_path), os.O_CREAT | os.O_RDWR)
+    try:
+        # A non-blocking flock keeps the timeout enforceable from Streamlit's worker threads,
+        # where SIGALRM cannot be used.
+        delay = LOCK_RETRY_INITIAL_SECONDS
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Could not acquire lock for {file_path}")
+                time.sleep(delay)
+                delay = min(delay * 2, LOCK_RETRY_MAX_SECONDS)
+
+        os.ftruncate(fd, 0)
+        os.write(fd, _PID_BYTES)
+        yield
+    finally:
+        # Closing the descriptor releases the flock. The lockfile itself is kept: unlinking it
+        # would let a new process lock a fresh inode while a waiter still holds the old one.
+        os.close(fd)
+
+
+@contextmanager
+def _exclusive_create_lock(
+    file_path: Path,
+    lock_path: Path,
+    timeout_seconds: float,
+) -> Generator[None, None, None]:
+    """Acquire a lock by exclusively creating the lockfile, for platforms without flock."""
     start_time = time.time()
+    delay = LOCK_RETRY_INITIAL_SECONDS
 
     while True:
         try:
@@ -103,10 +300,11 @@ def file_lock(file_path: Path, timeout_seconds: float = 10.0) -> Generator[None,
         except FileExistsError:
             if time.time() - start_time > timeout_seconds:
                 raise TimeoutError(f"Could not acquire lock for {file_path}")
-            time.sleep(0.05)
+            time.sleep(delay)
+            delay = min(delay * 2, LOCK_RETRY_MAX_SECONDS)
 
     try:
-        os.write(fd, str(os.getpid()).encode("utf-8"))
+        os.write(fd, _PID_BYTES)
         yield
     finally:
         os.close(fd)
@@ -119,25 +317,98 @@ def file_lock(file_path: Path, timeout_seconds: float = 10.0) -> Generator[None,
 def atomic_write_dataframe(dataframe: pd.DataFrame, target_path: Path) -> None:
     """Write a dataframe atomically to CSV by replacing a temporary file."""
     target_path.parent.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        newline="",
-        delete=False,
-        dir=target_path.parent,
-        suffix=".tmp",
-    ) as tmp_file:
-        dataframe.to_csv(tmp_file.name, index=False)
-        temp_name = tmp_file.name
+    fd, temp_name = tempfile.mkstemp(dir=target_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb", buffering=1 << 20) as tmp_file:
+            if pa is not None and _is_text_frame(dataframe):
+                _write_csv_arrow(dataframe, tmp_file)
+            else:
+                dataframe.to_csv(tmp_file, index=False, lineterminator="\n", quoting=csv.QUOTE_ALL)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+    except BaseException:
+        os.remove(temp_name)
+        raise
 
     os.replace(temp_name, target_path)
 
 
+def _is_text_frame(dataframe: pd.DataFrame) -> bool:
+    """Return whether every column holds only text or booleans, the cells pyarrow can format."""
+    return all(
+        pd.api.types.infer_dtype(dataframe.iloc[:, position], skipna=True) in ARROW_CSV_INFERRED_TYPES
+        for position in range(dataframe.shape[1])
+    )
+
+
+def _write_csv_arrow(dataframe: pd.DataFrame, file_obj) -> None:
+    """Write a text/boolean dataframe with pyarrow; bytes match ``to_csv(quoting=csv.QUOTE_ALL)``."""
+    # Missing values become "" and booleans "True"/"False". Other types (datetimes, numbers)
+    # would not format like to_csv, so _is_text_frame keeps them on the pandas writer.
+    text_df = dataframe.astype(object).where(dataframe.notna(), "").astype(str)
+    pa_csv.write_csv(pa.Table.from_pandas(text_df, preserve_index=False), file_obj)
+
+
+def file_signature(file_path: Path) -> Tuple[int, float]:
+    """Return a cheap (size, mtime) signature used to key file caches."""
+    stat_result = file_path.stat()
+    return stat_result.st_size, stat_result.st_mtime
+
+
+def read_csv_as_text(file_path: Path, usecols: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """Read a CSV with every column as text and empty strings for missing values."""
+    if pa is not None:
+        header = read_csv_header(file_path)
+        if header and len(set(header)) == len(header):
+            try:
+                return _read_csv_arrow(file_path, header, usecols)
+            except pa.ArrowInvalid:
+                pass  # Ragged rows; the C parser pads short rows with "" as before.
+
+    # With NA detection off the parser yields "" for empty fields directly, no fillna pass.
+    return pd.read_csv(
+        file_path,
+        dtype=str,
+        engine="c",
+        keep_default_na=False,
+        na_filter=False,
+        usecols=usecols,
+    )
+
+
+def _read_csv_arrow(file_path: Path, header: List[str], usecols: Optional[Sequence[str]]) -> pd.DataFrame:
+    """Read a CSV with pyarrow's multi-threaded reader, typing every column as string up front."""
+    # pd.read_csv(engine="pyarrow") infers types before applying dtype=str, which turns
+    # "00123" into "123" and rewrites timestamps; declaring string columns avoids inference.
+    convert_options = pa_csv.ConvertOptions(
+        column_types={column: pa.string() for column in header},
+        include_columns=list(usecols) if usecols is not None else None,
+        # Like na_filter=False on the C engine: "", "NA" and "NaN" stay literal text, never nulls.
+        strings_can_be_null=False,
+        quoted_strings_can_be_null=False,
+    )
+    table = pa_csv.read_csv(
+        str(file_path),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=convert_options,
+    )
+    return table.to_pandas()
+
+
+def read_csv_header(file_path: Path) -> List[str]:
+    """Return the header row of a CSV without parsing the body."""
+    with open(file_path, newline="", encoding="utf-8-sig") as csv_file:
+        return next(csv.reader(csv_file), [])
+
+
 def read_csv_or_empty(file_path: Path, columns: list[str]) -> pd.DataFrame:
     """Read a CSV if it exists; otherwise return an empty dataframe with columns."""
     if not file_path.exists():
         return pd.DataFrame(columns=columns)
 
-    dataframe = pd.read_csv(file_path, dtype=str).fillna("")
+    header = set(read_csv_header(file_path))
+    present_columns = [column for column in columns if column in header]
+    dataframe = read_csv_as_text(file_path, usecols=present_columns or None)
     for column in columns:
         if column not in dataframe.columns:
             dataframe[column] = ""
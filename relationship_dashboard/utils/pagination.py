@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-import math
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
 
 
 def compute_total_pages(total_rows: int, page_size: int) -> int:
     """Compute the total number of pages for the provided page size."""
     if page_size <= 0:
         return 1
-    return max(1, math.ceil(total_rows / page_size))
+    return max(1, (total_rows + page_size - 1) // page_size)
 
 
 def clamp_page_number(page_number: int, total_pages: int) -> int:
@@ -23,3 +26,15 @@ def page_slice(page_number: int, page_size: int) -> Tuple[int, int]:
     start = (page_number - 1) * page_size
     end = start + page_size
     return start, end
+
+
+def page_view(dataframe: pd.DataFrame, page_number: int, page_size: int) -> pd.DataFrame:
+    """Return the rows of the selected page as a positional slice of ``dataframe``."""
+    start, end = page_slice(page_number, page_size)
+    return dataframe.iloc[start:end]
+
+
+def page_slice_arrow(table: pa.Table, page_number: int, page_size: int) -> pa.Table:
+    """Return the selected page of an Arrow table as a zero-copy slice."""
+    start, _ = page_slice(page_number, page_size)
+    return table.slice(start, page_size)